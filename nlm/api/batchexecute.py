@@ -291,20 +291,22 @@ class Client:
                     data=None
                 )
 
-                # Handle data
+                # Handle data: parse the embedded JSON exactly once and hand the
+                # parsed structure up, instead of re-encoding it only for the
+                # RPC layer to parse it again.
                 if rpc_data[2] is not None:
                     if isinstance(rpc_data[2], str):
                         try:
-                            data = json.loads(rpc_data[2])
-                            resp.data = json.dumps(data)  # Re-encode for consistent format
+                            resp.data = json.loads(rpc_data[2])
                         except json.JSONDecodeError:
                             # Try unescaping first
                             try:
                                 unescaped = json.loads(f'"{rpc_data[2]}"')
-                                data = json.loads(unescaped)
-                                resp.data = json.dumps(data)
+                                resp.data = json.loads(unescaped)
                             except (json.JSONDecodeError, ValueError):
                                 resp.data = rpc_data[2]
+                    else:
+                        resp.data = rpc_data[2]
 
                 # Handle index
                 if rpc_data[6] == "generic":
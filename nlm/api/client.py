@@ -197,7 +197,10 @@ class Client:
                         if len(metadata) > 4 and metadata[4]:
                             try:
                                 source_type_value = int(metadata[4])
-                                source_metadata.source_type = SourceType(source_type_value)
+                                # Direct member-map lookup skips the Enum __call__ machinery
+                                source_metadata.source_type = SourceType._value2member_map_.get(
+                                    source_type_value, SourceType.SOURCE_TYPE_UNSPECIFIED
+                                )
                             except (ValueError, TypeError):
                                 if self.debug:
                                     print(f"Invalid source type: {metadata[4]}")
@@ -211,7 +214,9 @@ class Client:
                         settings = SourceSettings()
                         try:
                             status_value = int(settings_data[1])
-                            settings.status = SourceStatus(status_value)
+                            settings.status = SourceStatus._value2member_map_.get(
+                                status_value, SourceStatus.SOURCE_STATUS_UNSPECIFIED
+                            )
                         except (ValueError, TypeError):
                             if self.debug:
                                 print(f"Invalid status value: {settings_data[1]}")
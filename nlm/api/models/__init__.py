@@ -1,10 +1,13 @@
+import base64
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from typing import List, Optional, Union
 from datetime import datetime
 
 
-class SourceType(Enum):
+# IntEnum so members compare equal to the raw wire ints without .value
+# (e.g. source.metadata.source_type == 6) and serialize as plain ints.
+class SourceType(IntEnum):
     SOURCE_TYPE_UNSPECIFIED = 0
     SOURCE_TYPE_UNKNOWN = 1
     SOURCE_TYPE_GOOGLE_DOCS = 3
@@ -16,14 +19,14 @@ class SourceType(Enum):
     SOURCE_TYPE_YOUTUBE_VIDEO = 9
 
 
-class SourceStatus(Enum):
+class SourceStatus(IntEnum):
     SOURCE_STATUS_UNSPECIFIED = 0
     SOURCE_STATUS_ENABLED = 1
     SOURCE_STATUS_DISABLED = 2
     SOURCE_STATUS_ERROR = 3
 
 
-class SourceIssueReason(Enum):
+class SourceIssueReason(IntEnum):
     REASON_UNSPECIFIED = 0
     REASON_TEMPORARY_SERVER_ERROR = 1
     REASON_PERMANENT_SERVER_ERROR = 2
@@ -112,13 +115,15 @@ class AudioOverviewResult:
     title: str = ""
     audio_data: str = ""  # Base64 encoded audio data
     is_ready: bool = False
+    _decoded: Optional[bytes] = field(default=None, repr=False, compare=False)
 
     def get_audio_bytes(self):
-        """Returns the decoded audio data as bytes."""
+        """Returns the decoded audio data as bytes (memoized per instance)."""
         if not self.audio_data:
             raise ValueError("No audio data available")
-        import base64
-        return base64.b64decode(self.audio_data)
+        if self._decoded is None:
+            self._decoded = base64.b64decode(self.audio_data)
+        return self._decoded
 
 
 @dataclass
@@ -1,12 +1,90 @@
+import io
 import os
 import sys
 import click
-from typing import List, Optional, Tuple
-import json
-from pathlib import Path
+from functools import lru_cache
+from typing import List
 
-from .api.client import Client
-from .auth import handle_auth, load_stored_env
+# The API client and auth modules are imported lazily at their use sites:
+# commands like --help and hb never need the HTTP stack, and deferring the
+# imports keeps CLI cold start to click + stdlib. The models module is
+# stdlib-only, so importing it here is cheap.
+from .api.models import SourceStatus, SourceType
+
+# Enum -> display string, computed once so list_sources doesn't strip the
+# prefix with a fresh str.replace per row.
+_STATUS_NAMES = {v: v.name.replace("SOURCE_STATUS_", "", 1) for v in SourceStatus}
+_TYPE_NAMES = {v: v.name.replace("SOURCE_TYPE_", "", 1) for v in SourceType}
+
+
+# Single pre-built usage text; one write() instead of ~30 buffered print()
+# calls when showing help.
+_USAGE = """\
+Usage: nlm <command> [arguments]
+
+Notebook Commands:
+  list, ls          List all notebooks
+  create <title>    Create a new notebook
+  rm <id>           Delete a notebook
+  analytics <id>    Show notebook analytics
+
+Source Commands:
+  sources <id>      List sources in notebook
+  add <id> <input>  Add source to notebook
+  rm-source <id> <source-id>  Remove source
+  rename-source <source-id> <new-name>  Rename source
+  refresh-source <source-id>  Refresh source content
+  check-source <source-id>  Check source freshness
+
+Note Commands:
+  notes <id>        List notes in notebook
+  new-note <id> <title>  Create new note
+  edit-note <id> <note-id> <content>  Edit note
+  rm-note <note-id>  Remove note
+
+Audio Commands:
+  audio-create <id> <instructions>  Create audio overview
+  audio-get <id>    Get audio overview
+  audio-rm <id>     Delete audio overview
+  audio-share <id>  Share audio overview
+
+Generation Commands:
+  generate-guide <id>  Generate notebook guide
+  generate-outline <id>  Generate content outline
+  generate-section <id>  Generate new section
+
+Chat Commands:
+  chat <id> "<question>"  Ask a question based on notebook sources
+
+Other Commands:
+  auth              Setup authentication
+"""
+
+
+def _confirm(prompt: str) -> bool:
+    """Ask a yes/no question; returns True only on an explicit yes."""
+    # input() takes the prompt directly, saving the separate print() call
+    # and letting readline handle stdout/stderr sync
+    return input(prompt + " [y/N] ")[:1].lower() == "y"
+
+
+@lru_cache(maxsize=1)
+def _stored_env():
+    """Read ~/.nlm/env once per process; callers share the parsed result."""
+    from .auth import load_stored_env
+    return load_stored_env()
+
+
+@lru_cache(maxsize=4)
+def _get_client(auth_token, cookies, debug):
+    """Build (or reuse) an API client for the given credentials.
+
+    Memoized at module scope so multiple ServiceCLI instances in one
+    process share a client — and with it the underlying requests.Session
+    connection pool — instead of re-doing TLS setup per instance.
+    """
+    from .api.client import Client
+    return Client(auth_token, cookies, debug)
 
 
 class ServiceCLI:
@@ -16,12 +94,16 @@ class ServiceCLI:
         self.cookies = os.environ.get("NLM_COOKIES", "")
         self.debug = False
         self.client = None
-        
+        self._env_loaded = False
+
     def load_env(self):
         """Load environment variables."""
+        if self._env_loaded:
+            return
+        self._env_loaded = True
         # Try to load from stored env
         if not self.auth_token or not self.cookies:
-            auth_token, cookies = load_stored_env()
+            auth_token, cookies = _stored_env()
             if auth_token:
                 self.auth_token = auth_token
             if cookies:
@@ -33,13 +115,8 @@ class ServiceCLI:
             if not self.auth_token or not self.cookies:
                 print("Authentication required. Run 'nlm auth' first.")
                 sys.exit(1)
-                if self.debug:
-                    print(f"DEBUG: Initializing Client with:")
-                    print(f"  Auth Token (len={len(self.auth_token)}): '{self.auth_token[:20]}...'") # Display first 20 chars
-                    print(f"  Cookies (len={len(self.cookies)}): '{self.cookies[:50]}...'") # Display first 50 chars
-                    
-                self.client = Client(self.auth_token, self.cookies, self.debug)
-            self.client = Client(self.auth_token, self.cookies, self.debug)
+
+            self.client = _get_client(self.auth_token, self.cookies, self.debug)
             
     def run_command(self, cmd: str, args: List[str]):
         """Run a command."""
@@ -47,6 +124,7 @@ class ServiceCLI:
         
         # Handle auth command separately
         if cmd == "auth":
+            from .auth import handle_auth
             auth_token, cookies, err = handle_auth(args, self.debug)
             if err:
                 print(f"Error: {err}")
@@ -55,181 +133,57 @@ class ServiceCLI:
             self.cookies = cookies
             return
             
+        # Heartbeat is a no-op; it doesn't need a client
+        if cmd == "hb":
+            return
+
+        # O(1) table lookup instead of a chain of string comparisons
+        entry = _DISPATCH.get(cmd)
+        if entry is None:
+            self.print_usage()
+            sys.exit(1)
+
+        handler, argc, usage = entry
+        if len(args) != argc:
+            print(f"Usage: {usage}")
+            sys.exit(1)
+
         # For other commands, initialize client
         self.init_client()
-        
-        # Dispatch to appropriate handler
+
         try:
-            # Notebook operations
-            if cmd in ["list", "ls"]:
-                self.list_notebooks()
-            elif cmd == "create":
-                if len(args) != 1:
-                    print("Usage: nlm create <title>")
-                    sys.exit(1)
-                self.create_notebook(args[0])
-            elif cmd == "rm":
-                if len(args) != 1:
-                    print("Usage: nlm rm <id>")
-                    sys.exit(1)
-                self.remove_notebook(args[0])
-                
-            # Source operations
-            elif cmd == "sources":
-                if len(args) != 1:
-                    print("Usage: nlm sources <notebook-id>")
-                    sys.exit(1)
-                self.list_sources(args[0])
-            elif cmd == "add":
-                if len(args) != 2:
-                    print("Usage: nlm add <notebook-id> <file>")
-                    sys.exit(1)
-                source_id = self.add_source(args[0], args[1])
-                print(source_id)
-            elif cmd == "rm-source":
-                if len(args) != 2:
-                    print("Usage: nlm rm-source <notebook-id> <source-id>")
-                    sys.exit(1)
-                self.remove_source(args[0], args[1])
-            elif cmd == "rename-source":
-                if len(args) != 2:
-                    print("Usage: nlm rename-source <source-id> <new-name>")
-                    sys.exit(1)
-                self.rename_source(args[0], args[1])
-                
-            # Note operations
-            elif cmd == "new-note":
-                if len(args) != 2:
-                    print("Usage: nlm new-note <notebook-id> <title>")
-                    sys.exit(1)
-                self.create_note(args[0], args[1])
-            elif cmd == "update-note":
-                if len(args) != 4:
-                    print("Usage: nlm update-note <notebook-id> <note-id> <content> <title>")
-                    sys.exit(1)
-                self.update_note(args[0], args[1], args[2], args[3])
-            elif cmd == "rm-note":
-                if len(args) != 1:
-                    print("Usage: nlm rm-note <notebook-id> <note-id>")
-                    sys.exit(1)
-                self.remove_note(args[0], args[1])
-                
-            # Audio operations
-            elif cmd == "audio-create":
-                if len(args) != 2:
-                    print("Usage: nlm audio-create <notebook-id> <instructions>")
-                    sys.exit(1)
-                self.create_audio_overview(args[0], args[1])
-            elif cmd == "audio-get":
-                if len(args) != 1:
-                    print("Usage: nlm audio-get <notebook-id>")
-                    sys.exit(1)
-                self.get_audio_overview(args[0])
-            elif cmd == "audio-rm":
-                if len(args) != 1:
-                    print("Usage: nlm audio-rm <notebook-id>")
-                    sys.exit(1)
-                self.delete_audio_overview(args[0])
-            elif cmd == "audio-share":
-                if len(args) != 1:
-                    print("Usage: nlm audio-share <notebook-id>")
-                    sys.exit(1)
-                self.share_audio_overview(args[0])
-                
-            # Generation operations
-            elif cmd == "generate-guide":
-                if len(args) != 1:
-                    print("Usage: nlm generate-guide <notebook-id>")
-                    sys.exit(1)
-                self.generate_notebook_guide(args[0])
-            elif cmd == "generate-outline":
-                if len(args) != 1:
-                    print("Usage: nlm generate-outline <notebook-id>")
-                    sys.exit(1)
-                self.generate_outline(args[0])
-            elif cmd == "generate-section":
-                if len(args) != 1:
-                    print("Usage: nlm generate-section <notebook-id>")
-                    sys.exit(1)
-                self.generate_section(args[0])
-
-            # Chat operation
-            elif cmd == "chat":
-                if len(args) != 2:
-                    print("Usage: nlm chat <notebook-id> \"<question>\"")
-                    sys.exit(1)
-                self.chat(args[0], args[1])
-                
-            # Other operations
-            elif cmd == "hb":  # Heartbeat
-                pass  # Do nothing
-            else:
-                self.print_usage()
-                sys.exit(1)
+            handler(self, *args)
         except Exception as e:
             print(f"Error: {e}")
             sys.exit(1)
             
     def print_usage(self):
         """Print CLI usage information."""
-        print("Usage: nlm <command> [arguments]\n")
-        print("Notebook Commands:")
-        print("  list, ls          List all notebooks")
-        print("  create <title>    Create a new notebook")
-        print("  rm <id>           Delete a notebook")
-        print("  analytics <id>    Show notebook analytics\n")
-        
-        print("Source Commands:")
-        print("  sources <id>      List sources in notebook")
-        print("  add <id> <input>  Add source to notebook")
-        print("  rm-source <id> <source-id>  Remove source")
-        print("  rename-source <source-id> <new-name>  Rename source")
-        print("  refresh-source <source-id>  Refresh source content")
-        print("  check-source <source-id>  Check source freshness\n")
-        
-        print("Note Commands:")
-        print("  notes <id>        List notes in notebook")
-        print("  new-note <id> <title>  Create new note")
-        print("  edit-note <id> <note-id> <content>  Edit note")
-        print("  rm-note <note-id>  Remove note\n")
-        
-        print("Audio Commands:")
-        print("  audio-create <id> <instructions>  Create audio overview")
-        print("  audio-get <id>    Get audio overview")
-        print("  audio-rm <id>     Delete audio overview")
-        print("  audio-share <id>  Share audio overview\n")
-        
-        print("Generation Commands:")
-        print("  generate-guide <id>  Generate notebook guide")
-        print("  generate-outline <id>  Generate content outline")
-        print("  generate-section <id>  Generate new section\n")
-
-        print("Chat Commands:")
-        print("  chat <id> \"<question>\"  Ask a question based on notebook sources\n")
-        
-        print("Other Commands:")
-        print("  auth              Setup authentication")
+        sys.stdout.write(_USAGE)
         
     # Notebook operations
     def list_notebooks(self):
         """List all notebooks."""
         notebooks = self.client.list_recently_viewed_projects()
-        
-        # Print header
-        print("ID\tTITLE\tLAST UPDATED")
-        
-        # Print notebooks in same format as Go implementation
+
+        # Accumulate rows and flush with a single write instead of one
+        # syscall-per-notebook through print()
+        rows = ["ID\tTITLE\tLAST UPDATED"]
+
+        # Same format as the Go implementation
         for nb in notebooks:
             # Handle last updated time - use create_time as in Go code
+            metadata = nb.metadata
             last_updated = ""
-            if nb.metadata and nb.metadata.create_time:
-                last_updated = nb.metadata.create_time.isoformat()
-                
+            if metadata and metadata.create_time:
+                last_updated = metadata.create_time.isoformat()
+
             # Format title with emoji
             title = f"{nb.emoji} {nb.title}" if nb.emoji else nb.title
-            
-            # Print the notebook line
-            print(f"{nb.project_id}\t{title}\t{last_updated}")
+
+            rows.append(f"{nb.project_id}\t{title}\t{last_updated}")
+
+        sys.stdout.write("\n".join(rows) + "\n")
             
     def create_notebook(self, title: str):
         """Create a new notebook."""
@@ -238,75 +192,88 @@ class ServiceCLI:
         
     def remove_notebook(self, notebook_id: str):
         """Delete a notebook."""
-        print(f"Are you sure you want to delete notebook {notebook_id}? [y/N] ", end="")
-        response = input().lower()
-        
-        if not response.startswith("y"):
+        if not _confirm(f"Are you sure you want to delete notebook {notebook_id}?"):
             print("Operation cancelled")
             sys.exit(1)
-            
+
         self.client.delete_projects([notebook_id])
         
     # Source operations
     def list_sources(self, notebook_id: str):
         """List sources in a notebook."""
         project = self.client.get_project(notebook_id)
-        
-        # Print header
-        print("ID\tTITLE\tTYPE\tSTATUS\tLAST UPDATED")
-        
-        # Print each source in the notebook
+
+        # Accumulate rows and flush with a single write
+        rows = ["ID\tTITLE\tTYPE\tSTATUS\tLAST UPDATED"]
+
         for src in project.sources:
+            metadata = src.metadata
+            settings = src.settings
+
             # Handle source status
             status = "ENABLED"
-            if src.settings:
-                status = src.settings.status.name.replace("SOURCE_STATUS_", "")
-                
+            if settings:
+                status = _STATUS_NAMES[settings.status]
+
             # Handle last updated time
             last_updated = "unknown"
-            if src.metadata and src.metadata.last_modified_time:
-                last_updated = src.metadata.last_modified_time.isoformat()
-                
+            if metadata and metadata.last_modified_time:
+                last_updated = metadata.last_modified_time.isoformat()
+
             # Handle source type
             source_type = "UNKNOWN"
-            if src.metadata:
-                source_type = src.metadata.source_type.name.replace("SOURCE_TYPE_", "")
-                
-            # Print the source line
-            print(f"{src.source_id.source_id}\t{src.title}\t{source_type}\t{status}\t{last_updated}")
+            if metadata:
+                source_type = _TYPE_NAMES[metadata.source_type]
+
+            rows.append(f"{src.source_id.source_id}\t{src.title}\t{source_type}\t{status}\t{last_updated}")
+
+        sys.stdout.write("\n".join(rows) + "\n")
             
     def add_source(self, notebook_id: str, input_path: str) -> str:
         """Add a source to a notebook."""
         # Handle special input designators
         if input_path == "-":  # stdin
             print("Reading from stdin...")
-            return self.client.add_source_from_reader(notebook_id, sys.stdin.buffer, "Pasted Text")
+            # Read through a 1 MiB buffer so large pasted documents arrive
+            # in a handful of syscalls instead of 8 KiB default-sized reads.
+            raw = getattr(sys.stdin.buffer, "raw", sys.stdin.buffer)
+            reader = io.BufferedReader(raw, buffer_size=1 << 20)
+            return self.client.add_source_from_reader(notebook_id, reader, "Pasted Text")
         if not input_path:  # empty input
             raise ValueError("Input required (file, URL, or '-' for stdin)")
             
         # Check if input is a URL
-        if input_path.startswith("http://") or input_path.startswith("https://"):
+        if input_path.startswith(("http://", "https://")):
             print(f"Adding source from URL: {input_path}")
             return self.client.add_source_from_url(notebook_id, input_path)
             
-        # Try as local file
-        if os.path.exists(input_path):
-            print(f"Adding source from file: {input_path}")
-            return self.client.add_source_from_file(notebook_id, input_path)
-            
+        # Try as local file. Opening directly (EAFP) saves the extra stat
+        # of an os.path.exists pre-check; anything that isn't an openable
+        # path (missing file, directory, text too long to be a filename)
+        # falls through to the text branch.
+        try:
+            f = open(input_path, "rb")
+        except PermissionError:
+            raise
+        except (OSError, ValueError):
+            pass
+        else:
+            with f:
+                print(f"Adding source from file: {input_path}")
+                return self.client.add_source_from_reader(
+                    notebook_id, f, os.path.basename(input_path)
+                )
+
         # If it's not a URL or file, treat as direct text content
         print("Adding text content as source...")
         return self.client.add_source_from_text(notebook_id, input_path, "Text Source")
         
     def remove_source(self, notebook_id: str, source_id: str):
         """Remove a source from a notebook."""
-        print(f"Are you sure you want to remove source {source_id}? [y/N] ", end="")
-        response = input().lower()
-        
-        if not response.startswith("y"):
+        if not _confirm(f"Are you sure you want to remove source {source_id}?"):
             print("Operation cancelled")
             sys.exit(1)
-            
+
         self.client.delete_sources(notebook_id, [source_id])
         print(f"✅ Removed source {source_id} from notebook {notebook_id}")
         
@@ -334,13 +301,10 @@ class ServiceCLI:
         
     def remove_note(self, notebook_id: str, note_id: str):
         """Remove a note."""
-        print(f"Are you sure you want to remove note {note_id}? [y/N] ", end="")
-        response = input().lower()
-        
-        if not response.startswith("y"):
+        if not _confirm(f"Are you sure you want to remove note {note_id}?"):
             print("Operation cancelled")
             sys.exit(1)
-            
+
         self.client.delete_notes(notebook_id, [note_id])
         print(f"✅ Removed note: {note_id}")
         
@@ -404,13 +368,10 @@ class ServiceCLI:
                 
     def delete_audio_overview(self, project_id: str):
         """Delete an audio overview."""
-        print("Are you sure you want to delete the audio overview? [y/N] ", end="")
-        response = input().lower()
-        
-        if not response.startswith("y"):
+        if not _confirm("Are you sure you want to delete the audio overview?"):
             print("Operation cancelled")
             sys.exit(1)
-            
+
         self.client.delete_audio_overview(project_id)
         print("✅ Deleted audio overview")
         
@@ -482,6 +443,41 @@ class ServiceCLI:
                  traceback.print_exc() # Print full traceback in debug mode
 
 
+# Command dispatch table: name -> (handler, expected argc, usage string).
+# Aliases are separate keys sharing a handler. Built once at import;
+# run_command resolves commands with a single dict lookup.
+_DISPATCH = {
+    # Notebook operations
+    "list": (ServiceCLI.list_notebooks, 0, "nlm list"),
+    "ls": (ServiceCLI.list_notebooks, 0, "nlm ls"),
+    "create": (ServiceCLI.create_notebook, 1, "nlm create <title>"),
+    "rm": (ServiceCLI.remove_notebook, 1, "nlm rm <id>"),
+    # Source operations
+    "sources": (ServiceCLI.list_sources, 1, "nlm sources <notebook-id>"),
+    "add": (
+        lambda self, notebook_id, input_path: print(self.add_source(notebook_id, input_path)),
+        2, "nlm add <notebook-id> <file>",
+    ),
+    "rm-source": (ServiceCLI.remove_source, 2, "nlm rm-source <notebook-id> <source-id>"),
+    "rename-source": (ServiceCLI.rename_source, 2, "nlm rename-source <source-id> <new-name>"),
+    # Note operations
+    "new-note": (ServiceCLI.create_note, 2, "nlm new-note <notebook-id> <title>"),
+    "update-note": (ServiceCLI.update_note, 4, "nlm update-note <notebook-id> <note-id> <content> <title>"),
+    "rm-note": (ServiceCLI.remove_note, 2, "nlm rm-note <notebook-id> <note-id>"),
+    # Audio operations
+    "audio-create": (ServiceCLI.create_audio_overview, 2, "nlm audio-create <notebook-id> <instructions>"),
+    "audio-get": (ServiceCLI.get_audio_overview, 1, "nlm audio-get <notebook-id>"),
+    "audio-rm": (ServiceCLI.delete_audio_overview, 1, "nlm audio-rm <notebook-id>"),
+    "audio-share": (ServiceCLI.share_audio_overview, 1, "nlm audio-share <notebook-id>"),
+    # Generation operations
+    "generate-guide": (ServiceCLI.generate_notebook_guide, 1, "nlm generate-guide <notebook-id>"),
+    "generate-outline": (ServiceCLI.generate_outline, 1, "nlm generate-outline <notebook-id>"),
+    "generate-section": (ServiceCLI.generate_section, 1, "nlm generate-section <notebook-id>"),
+    # Chat operation
+    "chat": (ServiceCLI.chat, 2, "nlm chat <notebook-id> \"<question>\""),
+}
+
+
 @click.command(add_help_option=False, context_settings=dict(ignore_unknown_options=True))
 @click.option('--debug', is_flag=True, help='Enable debug output')
 @click.option('--auth', help='Auth token')